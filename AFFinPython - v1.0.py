@@ -4,38 +4,41 @@ copyright Nicholas La Delfa & Jim Potvin (2025) CC-BY-4.0
 last updated 2025-06-24
 
 If you use this code or method, please cite the original publication:
-    
-Nicholas J. La Delfa, Jim R. Potvin, 
-The ‘Arm Force Field’ method to predict manual arm strength based on only hand location and force direction, 
+
+Nicholas J. La Delfa, Jim R. Potvin,
+The ‘Arm Force Field’ method to predict manual arm strength based on only hand location and force direction,
 Applied Ergonomics, Volume 59, Part A, 2017, Pages 410-421
-ISSN 0003-6870, https://doi.org/10.1016/j.apergo.2016.09.012. 
+ISSN 0003-6870, https://doi.org/10.1016/j.apergo.2016.09.012.
 https://www.sciencedirect.com/science/article/pii/S0003687016302095
 """
 
 # Check and install required packages
 import subprocess
 import sys
-import importlib
+import importlib.util
+import math
 
 def install_package(package):
     """Install a package using pip if it's not already installed"""
-    try:
-        importlib.import_module(package)
-    except ImportError:
+    if importlib.util.find_spec(package) is None:
         print(f"Installing {package}...")
         subprocess.check_call([sys.executable, "-m", "pip", "install", package])
 
-# Check for required packages
-required_packages = ['numpy', 'scipy']
-for package in required_packages:
-    install_package(package)
+# Check for required packages (only when run as a script, so importing this
+# module does not pay the probe/install cost)
+required_packages = ['numpy', 'scipy', 'numba']
+if __name__ == "__main__":
+    for package in required_packages:
+        install_package(package)
 
 # Import required modules
 import numpy as np
-from scipy import stats
+from scipy.special import ndtri
+from numba import njit
 
 # Clear console (equivalent to clc in MATLAB)
-print("\033[H\033[J", end="")
+if __name__ == "__main__":
+    print("\033[H\033[J", end="")
 
 # Coordinate system: +x axis is Lateral Left, +y is Superior, +z is Anterior
 
@@ -45,221 +48,42 @@ CV = 0.277              # coefficient of variation for strength
 bm = 73.5               # body mass (kg)
 ht = 1.619              # stature (m)
 pc = 75                 # percent capable
-GravityG = np.array([0, -1, 0])  # gravity in Global Axis System
+GravityG = np.array([0.0, -1.0, 0.0])  # gravity in Global Axis System
+SIGN_L = np.array([1.0, 1.0, -1.0])    # reverses the lateral axis for the Left arm
+
+# build the "created for display" arrays inside score(); a compile-time
+# constant for numba, so their allocations vanish entirely when False
+_DEBUG = False
 
-# CofG distance ratios 
-UAcogR = 0.436          # Upper Arm CofG % of length, from shoulder   
+# CofG distance ratios
+UAcogR = 0.436          # Upper Arm CofG % of length, from shoulder
 FAcogR = 0.430          # Forearm CofG % of length, from elbow
 HcogR = 0.740           # Hand CofG % of length, from wrist
 
-# Body mass ratios 
+# Body mass ratios
 UAmassR = 0.0280        # Upper Arm mass as % of total body mass
 FAmassR = 0.0170        # Forearm
 HmassR = 0.0060         # Hand
 
-# Variable Inputs _______________________________________
-# coordinates for each joint and the direction of the force vectors
-#   1 = Left Hand/Knuckle     
-#   2 = Left Wrist     
-#   3 = Left Elbow        
-#   4 = Left Shoulder  
-
-#   5 = Right Hand/Knuckle
-#   6 = Right Wrist 
-#   7 = Right Elbow 
-#   8 = Right Shoulder 
-
-#   9 = C7T1 
-#   10 = L5S1 
-
-#   11 = Left Hand Force Vector (in Global)
-#   12 = Right Hand Force Vector (in Global)
-
-# Example coordinates (m) and hand loads (N)
-# this would be replaced with coordinate data from DHM
-xyz = np.array([
-    [0.29034, 0.91934, 0.29134],     # 0: Left Hand/Knuckle
-    [0.26170, 0.96619, 0.23538],     # 1: Left Wrist
-    [0.19100, 1.11068, 0.09171],     # 2: Left Elbow
-    [0.09191, 1.30461, -0.06136],    # 3: Left Shoulder
-    [-0.37368, 1.20097, 0.360862],   # 4: Right Hand/Knuckle
-    [-0.36905, 1.20173, 0.28260],    # 5: Right Wrist
-    [-0.42676, 1.28636, 0.09280],    # 6: Right Elbow
-    [-0.21538, 1.32291, -0.06481],   # 7: Right Shoulder
-    [-0.06385, 1.35457, -0.06182],   # 8: C7T1
-    [-0.06300, 0.95253, -0.07984],   # 9: L5S1
-    [0.000, 1.000, 0.000],           # 10: Left Hand Force Vector
-    [0.000, 1.000, 0.000]            # 11: Right Hand Force Vector
-])
-
-LActualLoad = 50        # actual force at the left knuckle (used to determine % capable)
-RActualLoad = 50        # at the right knuckle
-print("LActualLoad =", LActualLoad, "N")
-print("RActualLoad =", RActualLoad, "N")
-
-# Calculations ____________________________________________________________________________________________    
-
-# hand forces in Global Axis System (GAS) (x: +Lleft, y: +Up, z: +Anterior)
-LFG = xyz[10, :].copy()
-RFG = xyz[11, :].copy()
-
-# establish Shoulder Axis System (SAS)
-SAS = np.zeros((3, 3))
-SAS[2, :] = xyz[7, :] - xyz[3, :]
-temp = np.linalg.norm(SAS[2, :])
-SAS[2, :] = SAS[2, :] / temp    # Lateral unit vector in Shoulder Axis System (z)
-
-Trunk = xyz[8, :] - xyz[9, :]
-temp = np.linalg.norm(Trunk)
-Trunk = Trunk / temp
-
-SASt = np.zeros((3, 3))
-SASt[0, :] = np.cross(Trunk, SAS[2, :])    # Anterior unit vector in Shoulder Axis System (x)
-#print("SASt[0, :] =", SASt[0, :])
-temp = np.linalg.norm(SASt[0, :])
-SAS[0, :] = SASt[0, :] / temp
-
-SAS[1, :] = np.cross(SAS[2, :], SAS[0, :])    # Superior unit vector in Shoulder Axis System (y)
-#print("SAS =")
-#print(SAS)
-
-# joint locations in GAS
-LHG = xyz[0, :] - xyz[3, :]    # Left Hand wrt gravity
-LWG = xyz[1, :] - xyz[3, :]    # Left Wrist wrt gravity
-LEG = xyz[2, :] - xyz[3, :]    # Left Elbow wrt gravity
-
-RHG = xyz[4, :] - xyz[7, :]    # Right Hand wrt gravity
-RWG = xyz[5, :] - xyz[7, :]    # Right Wrist wrt gravity
-REG = xyz[6, :] - xyz[7, :]    # Right Elbow wrt gravity
-
-# joint locations in SAS
-LHSAS = np.dot(LHG, SAS.T)     # Left Hand wrt SAS
-LHSAS[2] = LHSAS[2] * -1       # note: switches lateral polarity so left is lateral for the left arm
-LWSAS = np.dot(LWG, SAS.T)     # Left Wrist wrt SAS
-LWSAS[2] = LWSAS[2] * -1
-LESAS = np.dot(LEG, SAS.T)     # Left Elbow wrt SAS
-LESAS[2] = LESAS[2] * -1
-LSAS = np.array([LHSAS, LWSAS, LESAS])    # created for display
-#print("LSAS =")
-#print(LSAS)
-
-RHSAS = np.dot(RHG, SAS.T)     # Right remains lateral for the right arm
-RWSAS = np.dot(RWG, SAS.T)     # Right Wrist wrt SAS
-RESAS = np.dot(REG, SAS.T)     # Right Elbow wrt SAS
-RSAS = np.array([RHSAS, RWSAS, RESAS])    # created for display
-#print("RSAS =")
-#print(RSAS)
-
-# gravity in SAS
-GravitySAS = np.dot(GravityG, SAS.T)    # Gravity vector wrt SAS
-#print("GravitySAS =", GravitySAS)
-
-# hand force unit vectors in Global
-LFG = LFG / np.linalg.norm(LFG)    # Left hand force unit vector wrt Gravity
-RFG = RFG / np.linalg.norm(RFG)    # Right hand force unit vector wrt Gravity
-FG = np.array([LFG, RFG])           # created for display
-#print("FG =")
-#print(FG)
-
-# hand force unit vectors in SAS
-LFSAS = np.dot(LFG, SAS.T)    # Left hand force wrt SAS
-RFSAS = np.dot(RFG, SAS.T)    # Right hand force wrt SAS
-FSAS = np.array([LFSAS, RFSAS])    # created for display
-#print("FSAS =")
-#print(FSAS)
-
-# segment CofG coordinates in SAS
-LUAcog = LESAS * UAcogR                                    # Left Upper Arm CofG
-LFAcog = LESAS + (LWSAS - LESAS) * FAcogR                # Left Forearm CofG
-LHcog = LWSAS + (LHSAS - LWSAS) * HcogR                  # Left Hand CofG
-Lcog = np.array([LUAcog, LFAcog, LHcog])                 # created for display
-#print("Lcog =")
-#print(Lcog)
-
-RUAcog = RESAS * UAcogR                                    # Right Upper Arm CofG
-RFAcog = RESAS + (RWSAS - RESAS) * FAcogR                # Right Forearm CofG
-RHcog = RWSAS + (RHSAS - RWSAS) * HcogR                  # Right Hand CofG
-Rcog = np.array([RUAcog, RFAcog, RHcog])                 # created for display
-#print("Rcog =")
-#print(Rcog)
-
-# Segment weights (N)
-UAwt = bm * UAmassR * 9.81    # Upper arm weight (right or left) 
-FAwt = bm * FAmassR * 9.81    # Forearm weight
-Hwt = bm * HmassR * 9.81      # Hand weight
-
-# Segment moments caused at shoulder
-# Left Arm
-LUAmom = np.cross(LUAcog, GravitySAS) * UAwt    # shoulder moment caused by Left Upper Arm
-LFAmom = np.cross(LFAcog, GravitySAS) * FAwt    # shoulder moment caused by Left Forearm
-LHmom = np.cross(LHcog, GravitySAS) * Hwt       # shoulder moment caused by Left Hand
-LTotmom = LUAmom + LFAmom + LHmom               # Left: total moment caused by gravity
-LTotmomRes = np.linalg.norm(LTotmom)            # Total shoulder moment caused by Left segments
-Lmom = np.array([[LUAmom[0], LUAmom[1], LUAmom[2], 0],
-                 [LFAmom[0], LFAmom[1], LFAmom[2], 0],
-                 [LHmom[0], LHmom[1], LHmom[2], 0],
-                 [LTotmom[0], LTotmom[1], LTotmom[2], LTotmomRes]])    # created for display
-#print("Lmom =")
-#print(Lmom)
-
-LTotmomUV = LTotmom / LTotmomRes
-LReach = np.linalg.norm(LHSAS)    # Left reach distance
-#print("LReach =", LReach)
-LReachUV = LHSAS / LReach         # Left reach unit vector
-Lassist = np.cross(LTotmomUV, LReachUV)    # Left direction of gravity contribution to MAS
-LGFEres = LTotmomRes / LReach     # Left Gravity Force Effect resultant
-LGFE = Lassist * LGFEres / np.linalg.norm(Lassist)    # Left Gravity Force Effect vector
-Lvectors = np.array([[LTotmomUV[0], LTotmomUV[1], LTotmomUV[2], 0],
-                     [LReachUV[0], LReachUV[1], LReachUV[2], 0],
-                     [Lassist[0], Lassist[1], Lassist[2], 0],
-                     [LGFE[0], LGFE[1], LGFE[2], LGFEres]])    # created for display
-#print("Lvectors =")
-#print(Lvectors)
-
-# Right Arm
-RUAmom = np.cross(RUAcog, GravitySAS) * UAwt    # shoulder moment caused by Right Upper Arm
-RFAmom = np.cross(RFAcog, GravitySAS) * FAwt    # shoulder moment caused by Right Forearm
-RHmom = np.cross(RHcog, GravitySAS) * Hwt       # shoulder moment caused by Right Hand
-RTotmom = RUAmom + RFAmom + RHmom               # Total shoulder moment caused by Right segments
-RTotmomRes = np.linalg.norm(RTotmom)
-Rmom = np.array([[RUAmom[0], RUAmom[1], RUAmom[2], 0],
-                 [RFAmom[0], RFAmom[1], RFAmom[2], 0],
-                 [RHmom[0], RHmom[1], RHmom[2], 0],
-                 [RTotmom[0], RTotmom[1], RTotmom[2], RTotmomRes]])    # created for display
-#print("Rmom =")
-#print(Rmom)
-
-RTotmomUV = RTotmom / RTotmomRes
-RReach = np.linalg.norm(RHSAS)    # Right reach distance
-#print("RReach =", RReach)
-RReachUV = RHSAS / RReach         # Right reach unit vector
-Rassist = np.cross(RTotmomUV, RReachUV)    # Right direction of gravity contribution to MAS
-RGFEres = RTotmomRes / RReach     # Right Gravity Force Effect resultant
-RGFE = Rassist * RGFEres / np.linalg.norm(Rassist)    # Right Gravity Force Effect vector
-Rvectors = np.array([[RTotmomUV[0], RTotmomUV[1], RTotmomUV[2], 0],
-                     [RReachUV[0], RReachUV[1], RReachUV[2], 0],
-                     [Rassist[0], Rassist[1], Rassist[2], 0],
-                     [RGFE[0], RGFE[1], RGFE[2], RGFEres]])    # created for display
-#print("Rvectors =")
-#print(Rvectors)
-
 # ___________________________________________________________________________
 
 # Artificial Neural Network
 
 # ANN coefficients (18 inputs, 13 nodes)
+# weights are held C-order float32, so Layer1c @ p streams one contiguous
+# 18-float row per node through the SIMD dot kernel
 
 in1offset = np.array([-0.4145454545454540,0.0000000000000000,-0.2000000000000000,0.0211450020362057,0.0000000000000000,0.0000000000000000,-1.0000000000000000,-1.0000000000000000,-1.0000000000000000,
-    -0.4720000000000000,-0.5072230027811940,-0.5021474062240250,0.0000000000000000,0.0000000000000000,0.0000000000000000,-0.4720000000000000,-0.5135528785197460,-0.5326927207332780])
+    -0.4720000000000000,-0.5072230027811940,-0.5021474062240250,0.0000000000000000,0.0000000000000000,0.0000000000000000,-0.4720000000000000,-0.5135528785197460,-0.5326927207332780], dtype=np.float32)
 
 in1gain = np.array([2.2437989556135800,3.8331616396348900,2.8838355012166200,3.9808719139870100,3.7210886709687600,3.5496613795916400,1.0000000000000000,1.0000000000000000,1.0000000000000000,
-    2.1041188125756200,2.0185852492594400,1.9796783114071000,3.7360574357315700,6.9790625815425600,13.0370893261040000,2.1186440677966100,1.9379162887927500,1.8726304261237400])
+    2.1041188125756200,2.0185852492594400,1.9796783114071000,3.7360574357315700,6.9790625815425600,13.0370893261040000,2.1186440677966100,1.9379162887927500,1.8726304261237400], dtype=np.float32)
 
 in1min = -1
 
-# Layer 1  
+# Layer 1
 Layer1b = np.array([-0.249390763050715,-0.100250151663260,0.095639766968571,0.101680098004717,0.245807318675936,1.196620804832640,-0.640172565850211,0.504404303005015,-0.934511666215270,-0.088019829568919,
-    -0.159442240916475,0.250629528273471,0.365963496484053])
+    -0.159442240916475,0.250629528273471,0.365963496484053], dtype=np.float32)
 
 Layer1c = np.array([
     [0.0396468197036280,0.5135914913409210,-0.1615158131460990,0.5335782521154120,0.3926468149028430,0.7784365394317120,-0.0902124024580994,-0.0258725059064285,-0.3186976135026210,0.1408568009578810,
@@ -288,253 +112,401 @@ Layer1c = np.array([
     0.0638667163600597,-0.2305280571308560,-0.0812576791473448,0.2206287611054260,-0.0940649002307790,-0.3564957901562640,-0.6196230305451320,0.1155897334030620],
     [0.0132468525879893,-0.8765998536722000,-0.0504484159893567,-0.0875696222338695,0.1449172648350600,0.8244006592929960,-0.0540479238588384,0.1144408906733490,-0.0399914698933143,0.4346560301984630,
     -0.0813723658678813,0.5068478617188480,1.0401589725829900,-0.4421187830849380,-0.2862908924579780,0.2308997829770930,-0.0823541762175492,-0.5335282381151980]
-])
+], dtype=np.float32)
 
-# Layer 2  
-Layer2b = 0.319619509557245
+# Layer 2
+Layer2b = np.float32(0.319619509557245)
 
 Layer2c = np.array([-0.726008728459171,-0.896119899552364,1.303898287490790,-0.963599520641712,0.892304171343111,-1.109496084791920,1.320456762815650,-0.881510511623027,1.197329700532090,-1.197641852318800,
-    -0.836429746366561,-0.853341101811818,1.697291156353840])
+    -0.836429746366561,-0.853341101811818,1.697291156353840], dtype=np.float32)
 
-# Output Layer  
+# Output Layer
 OUTmin = -1
 
 OUTgain = 0.0111758422535829
 
 OUToffset = 44.2451801385399
 
-# inputs to the ANN    (SI (y) , AP (z), ML (x))
-# Left Hand Inputs
-LANNin = np.zeros(18)
-LANNin[0] = LHSAS[1]                                               # Hand Location wrt Shoulder (r)
-LANNin[1] = LHSAS[0]
-LANNin[2] = LHSAS[2]
-LANNin[6] = LFSAS[1]                                               # direction cosine (DC) of Force unit vector (F)
-LANNin[7] = LFSAS[0]
-LANNin[8] = -LFSAS[2]       # reverse for Left arm
-LANNin[3] = np.sqrt(LANNin[1]**2 + LANNin[2]**2)                  # 2D Projection or r on plane
-LANNin[4] = np.sqrt(LANNin[0]**2 + LANNin[2]**2)
-LANNin[5] = np.sqrt(LANNin[0]**2 + LANNin[1]**2)
-LANNin[9] = (LANNin[1] * LANNin[8]) - (LANNin[2] * LANNin[7])     # DC of 3D moment arm (DC or r x F)
-LANNin[10] = (LANNin[2] * LANNin[6]) - (LANNin[0] * LANNin[8])
-LANNin[11] = (LANNin[0] * LANNin[7]) - (LANNin[1] * LANNin[6])
-LANNin[12] = np.sqrt(LANNin[9]**2 + LANNin[10]**2 + LANNin[11]**2)  # resultant of 3D moment arm (3DMA)
-LANNin[13] = LANNin[12]**2                                          # 3DMA^2
-LANNin[14] = LANNin[12]**3                                          # 3DMA^3
-LANNin[15] = LANNin[3] * LANNin[6]                                  # DC of F x 2D projection of r
-LANNin[16] = LANNin[4] * LANNin[7]
-LANNin[17] = LANNin[5] * LANNin[8]
-
-# Right Hand Inputs (same equations as for Left above)
-RANNin = np.zeros(18)
-RANNin[0] = RHSAS[1]      
-RANNin[1] = RHSAS[0]
-RANNin[2] = RHSAS[2]
-RANNin[6] = RFSAS[1]       
-RANNin[7] = RFSAS[0]
-RANNin[8] = RFSAS[2]      
-RANNin[3] = np.sqrt(RANNin[1]**2 + RANNin[2]**2)
-RANNin[4] = np.sqrt(RANNin[0]**2 + RANNin[2]**2)
-RANNin[5] = np.sqrt(RANNin[0]**2 + RANNin[1]**2)
-RANNin[9] = (RANNin[1] * RANNin[8]) - (RANNin[2] * RANNin[7])
-RANNin[10] = (RANNin[2] * RANNin[6]) - (RANNin[0] * RANNin[8])
-RANNin[11] = (RANNin[0] * RANNin[7]) - (RANNin[1] * RANNin[6])
-RANNin[12] = np.sqrt(RANNin[9]**2 + RANNin[10]**2 + RANNin[11]**2)
-RANNin[13] = RANNin[12]**2
-RANNin[14] = RANNin[12]**3
-RANNin[15] = RANNin[3] * RANNin[6]
-RANNin[16] = RANNin[4] * RANNin[7]
-RANNin[17] = RANNin[5] * RANNin[8]
-
-ANNin = np.column_stack((LANNin, RANNin))        # for display
-#print("ANNin =")
-#print(ANNin)
-
-# MaxMin Function to Modify the Original Input
-Lp = np.zeros(18)
-Rp = np.zeros(18)
-for i in range(18):        # 18 Inputs
-    Lp[i] = in1gain[i] * (LANNin[i] - in1offset[i]) - 1    # Left p values
-    Rp[i] = in1gain[i] * (RANNin[i] - in1offset[i]) - 1    # Right
-p = np.column_stack((Lp, Rp))     # for display
-#print("p =")
-#print(p)
-
-# Layer 1 operations
-Lsum = np.zeros(13)
-Rsum = np.zeros(13)
-La = np.zeros(13)
-Ra = np.zeros(13)
-Latemp = np.zeros((13, 18))
-Ratemp = np.zeros((13, 18))
-
-for n in range(13):        # 13 nodes
-    Lsum[n] = Layer1b[n]   # Layer 1 bias values 
-    Rsum[n] = Layer1b[n]
-    for i in range(18):    # 18 inputs
-        Latemp[n, i] = Lp[i] * Layer1c[n, i]     # summing (p * Layer 1 coefficients)
-        Lsum[n] = Lsum[n] + Latemp[n, i]         # for each Node
-        
-        Ratemp[n, i] = Rp[i] * Layer1c[n, i]     # right side
-        Rsum[n] = Rsum[n] + Ratemp[n, i]
-    
-    La[n] = np.tanh(Lsum[n])              # TanH of sum from Layer 1
-    Ra[n] = np.tanh(Rsum[n])    
-
-a = np.column_stack((La, Ra))    # for display
-#print("a =")
-#print(a)
-
-# Layer 2 operations
-Lsum2 = Layer2b                          # Layer 2 bias values
-Rsum2 = Layer2b
-for n in range(13):
-    Lsum2 = Lsum2 + (La[n] * Layer2c[n])       # summing values for Layer 2
-    Rsum2 = Rsum2 + (Ra[n] * Layer2c[n])
-
-#print("Lsum2 =", Lsum2)       # for display                        
-#print("Rsum2 =", Rsum2)
-
-# ANN Output
-Lmas = (Lsum2 + 1)/OUTgain + OUToffset    # ANN raw maximum arm strength estimates
-Rmas = (Rsum2 + 1)/OUTgain + OUToffset
-#print("Lmas =", Lmas)
-#print("Rmas =", Rmas)
-
 # __________________________________________________________________________________________________
 # Bounding Strength to Min and Max values observed in our studies
 # values are bounded based on the height of the hand wrt shoulder, and the direction of the force vector
 # (eg. if the force was anterior (+1) and inferior (-1) with no
 # medial/lateral component, the codes would be 1, -1, 0)
 
-# arrays of minimums and maximums for each code
-MinMAS = [51.3,49.9,49.9,51.3,51.3,49.9,51.3,49.9,49.9,51.3,64.3,49.9,72.3,9999.0,49.9,51.3,72.3,49.9,52.9,49.9,49.9,52.9,52.9,49.9,52.9,49.9,49.9,47.8,47.1,47.1,47.8,47.8,47.1,47.8,47.1,
+# flat arrays of minimums and maximums, indexed base-3: (ht+1)*27 + (ap+1)*9 + (si+1)*3 + (ml+1)
+MinMAS = np.array([51.3,49.9,49.9,51.3,51.3,49.9,51.3,49.9,49.9,51.3,64.3,49.9,72.3,9999.0,49.9,51.3,72.3,49.9,52.9,49.9,49.9,52.9,52.9,49.9,52.9,49.9,49.9,47.8,47.1,47.1,47.8,47.8,47.1,47.8,47.1,
     47.1,47.8,64.3,47.1,68.9,9999.0,53.1,47.8,72.3,47.1,52.9,51.4,51.4,52.9,52.9,51.4,52.9,51.4,51.4,44.2,44.2,44.2,44.2,44.2,44.2,44.2,44.2,44.2,44.2,64.3,44.2,65.5,9999.0,56.3,44.2,72.3,
-    44.2,52.9,52.9,52.9,52.9,52.9,52.9,52.9,52.9,52.9]
+    44.2,52.9,52.9,52.9,52.9,52.9,52.9,52.9,52.9,52.9], dtype=np.float32)
 
-MaxMAS = [223.2,223.2,223.2,223.2,223.2,223.2,223.2,223.2,223.2,223.2,120.0,223.2,133.4,-9999.0,99.3,223.2,125.7,223.2,184.1,184.1,184.1,184.1,184.1,184.1,184.1,184.1,184.1,220.5,220.5,220.5,220.5,
+MaxMAS = np.array([223.2,223.2,223.2,223.2,223.2,223.2,223.2,223.2,223.2,223.2,120.0,223.2,133.4,-9999.0,99.3,223.2,125.7,223.2,184.1,184.1,184.1,184.1,184.1,184.1,184.1,184.1,184.1,220.5,220.5,220.5,220.5,
     199.6,220.5,210.4,210.4,199.6,220.5,149.8,220.5,165.5,-9999.0,134.7,210.4,128.0,199.6,190.9,190.9,181.9,190.9,175.5,181.9,190.9,190.9,177.1,217.7,217.7,217.7,217.7,176.0,217.7,197.7,197.7,
-    176.0,217.7,179.7,217.7,197.7,-9999.0,170.2,197.7,130.2,176.0,197.7,197.7,179.7,197.7,166.9,179.7,197.7,197.7,170.2]
-
-# Height Code   (-1 for < - 0.01, 0 for between -0.01 & 0.01, 1 for > 0.01)
-Htband = 0.01
-Lht = 0
-if LHSAS[1] < -Htband:
-    Lht = -1
-elif LHSAS[1] > Htband:
-    Lht = 1
-
-Rht = 0
-if RHSAS[1] < -Htband:
-    Rht = -1
-elif RHSAS[1] > Htband:
-    Rht = 1
-
-# Ant/Post Force Code (-1 for negative, 0 for 0, +1 for positive)
-if LFSAS[0] == 0:
-    Lap = 0
-else:
-    Lap = LFSAS[0]/abs(LFSAS[0])
-#print("Lap =", Lap)
-
-if RFSAS[0] == 0:
-    Rap = 0
-else:
-    Rap = RFSAS[0]/abs(RFSAS[0])
-#print("Rap =", Rap)
-
-# Sup/Inferior Force Code  (-1 for negative, 0 for 0, +1 for positive)
-if LFSAS[1] == 0:
-    Lsi = 0
-else:
-    Lsi = LFSAS[1]/abs(LFSAS[1])
-
-if RFSAS[1] == 0:
-    Rsi = 0
-else:
-    Rsi = RFSAS[1]/abs(RFSAS[1])
-
-# Med/Lateral Force Code  (-1 for negative, 0 for 0, +1 for positive)
-if -LFSAS[2] == 0:           # must switch polarity for left side
-    Lml = 0
-else:
-    Lml = -LFSAS[2]/abs(LFSAS[2])  # do these need to be switched?
-
-if RFSAS[2] == 0:
-    Rml = 0
-else:
-    Rml = RFSAS[2]/abs(RFSAS[2])  # do these need to be switched?
-
-Lcode = [Lht, Lap, Lsi, Lml]
-Rcode = [Rht, Rap, Rsi, Rml]
-#print("Lcode =", Lcode)
-#print("Rcode =", Rcode)
-
-# creating 4D arrays of Minimums and Maximums from MinMax array above
-Min = np.zeros((3, 3, 3, 3))
-Max = np.zeros((3, 3, 3, 3))
-c = 0
-for ht in range(3):
-    for ap in range(3):
-        for si in range(3):
-            for ml in range(3):
-                Min[ht, ap, si, ml] = MinMAS[c]
-                Max[ht, ap, si, ml] = MaxMAS[c]
-                temp = [c, ht-1, ap-1, si-1, ml-1, Min[ht, ap, si, ml], Max[ht, ap, si, ml]]
-                c += 1
-#print("c =", c)
-
-# add 2 to each code for look-up in array
-Lmin = Min[int(Lht+2)-1, int(Lap+2)-1, int(Lsi+2)-1, int(Lml+2)-1]
-Lmax = Max[int(Lht+2)-1, int(Lap+2)-1, int(Lsi+2)-1, int(Lml+2)-1]
-Rmin = Min[int(Rht+2)-1, int(Rap+2)-1, int(Rsi+2)-1, int(Rml+2)-1]
-Rmax = Max[int(Rht+2)-1, int(Rap+2)-1, int(Rsi+2)-1, int(Rml+2)-1]
-
-# bounding to Minimum and Maximum MAS values
-if Lmas < Lmin:
-    Lmas = Lmin
-if Lmas > Lmax:
-    Lmas = Lmax
-if Rmas < Rmin:
-    Rmas = Rmin
-if Rmas > Rmax:
-    Rmas = Rmax
-
-t = 'Mean 0G MAS values'
-#print(t)
-#print("Lmas =", Lmas)   # for display
-#print("Rmas =", Rmas)
-
-# _____________________________________________________________________________________________        
-# Estimate of Zero-Gravity maximum arm strength (MAS) for selected population
-Lsd = Lmas * CV    # estimate of standard deviation based on mean and global CV value
-Rsd = Rmas * CV
+    176.0,217.7,179.7,217.7,197.7,-9999.0,170.2,197.7,130.2,176.0,197.7,197.7,179.7,197.7,166.9,179.7,197.7,197.7,170.2], dtype=np.float32)
+
+# Per-frame scoring ________________________________________________________________________________
+# the full calculation is compiled with numba so that per-frame calls from a
+# DHM stream do not pay NumPy dispatch overhead on every small-vector operation
+
+@njit(cache=True)
+def _cross3(a, b):
+    """3-vector cross product written out as scalars (no ufunc dispatch)"""
+    return np.array((a[1]*b[2] - a[2]*b[1],
+                     a[2]*b[0] - a[0]*b[2],
+                     a[0]*b[1] - a[1]*b[0]))
+
+@njit(cache=True)
+def score(xyz, bm, CV, zprob, Layer1b, Layer1c, Layer2b, Layer2c,
+          in1gain, in1offset, OUTgain, OUToffset, MinMAS, MaxMAS,
+          LActualLoad, RActualLoad):
+    """Score one frame of coordinate data.
+
+    xyz holds the ten joint locations plus the two hand force vectors (rows
+    as documented with the example data below); zprob is the standard-normal
+    z-score for the selected percent capable (computed once outside, since
+    scipy is not available in compiled code).  Returns the final MAS values
+    with gravity and the percent capable for each arm:
+    (LMASwG, RMASwG, LMASprob, RMASprob)
+    """
+
+    # establish Shoulder Axis System (SAS)
+    lat = xyz[7, :] - xyz[3, :]    # Lateral axis in Shoulder Axis System (z)
+    Trunk = xyz[8, :] - xyz[9, :]
+    ant = _cross3(Trunk, lat)      # Anterior axis in Shoulder Axis System (x)
+    sup = _cross3(lat, ant)        # Superior axis in Shoulder Axis System (y)
+
+    # cross product directions are scale-invariant, so the three axes are built
+    # unnormalized, scaled in place by scalar reciprocal square roots, and
+    # stacked into the rotation matrix once
+    ant *= 1.0 / math.sqrt(ant @ ant)
+    sup *= 1.0 / math.sqrt(sup @ sup)
+    lat *= 1.0 / math.sqrt(lat @ lat)
+    SAS = np.stack((ant, sup, lat))
+    #print("SAS =")
+    #print(SAS)
+
+    # joint locations in GAS
+    J = np.empty((6, 3))
+    J[:3, :] = xyz[0:3, :] - xyz[3, :]    # Left Hand/Wrist/Elbow wrt gravity
+    J[3:, :] = xyz[4:7, :] - xyz[7, :]    # Right Hand/Wrist/Elbow wrt gravity
+
+    # joint locations in SAS: one 6x3 by 3x3 product for all six joints
+    JSAS = J @ SAS.T
+    JSAS[:3, 2] *= -1.0    # note: switches lateral polarity so left is lateral for the left arm
+    LHSAS = JSAS[0]        # Left Hand wrt SAS
+    LWSAS = JSAS[1]        # Left Wrist wrt SAS
+    LESAS = JSAS[2]        # Left Elbow wrt SAS
+    RHSAS = JSAS[3]        # Right remains lateral for the right arm
+    RWSAS = JSAS[4]        # Right Wrist wrt SAS
+    RESAS = JSAS[5]        # Right Elbow wrt SAS
+    if _DEBUG:
+        LSAS = JSAS[:3]    # created for display
+        RSAS = JSAS[3:]
+        #print("LSAS =")
+        #print(LSAS)
+        #print("RSAS =")
+        #print(RSAS)
+
+    # gravity in SAS
+    GravitySAS = np.dot(GravityG, SAS.T)    # Gravity vector wrt SAS
+    #print("GravitySAS =", GravitySAS)
+
+    # hand forces in Global Axis System (GAS) (x: +Lleft, y: +Up, z: +Anterior),
+    # normalized to unit vectors in one pass (the division allocates a fresh
+    # array, so the xyz rows need no defensive copy)
+    LFG = xyz[10, :] / np.linalg.norm(xyz[10, :])    # Left hand force unit vector wrt Gravity
+    RFG = xyz[11, :] / np.linalg.norm(xyz[11, :])    # Right hand force unit vector wrt Gravity
+    if _DEBUG:
+        FG = np.stack((LFG, RFG))    # created for display
+        #print("FG =")
+        #print(FG)
+
+    # hand force unit vectors in SAS
+    LFSAS = np.dot(LFG, SAS.T)    # Left hand force wrt SAS
+    RFSAS = np.dot(RFG, SAS.T)    # Right hand force wrt SAS
+    if _DEBUG:
+        FSAS = np.stack((LFSAS, RFSAS))    # created for display
+        #print("FSAS =")
+        #print(FSAS)
+
+    # segment CofG coordinates in SAS
+    LUAcog = LESAS * UAcogR                                    # Left Upper Arm CofG
+    LFAcog = LESAS + (LWSAS - LESAS) * FAcogR                # Left Forearm CofG
+    LHcog = LWSAS + (LHSAS - LWSAS) * HcogR                  # Left Hand CofG
+    if _DEBUG:
+        Lcog = np.stack((LUAcog, LFAcog, LHcog))    # created for display
+        #print("Lcog =")
+        #print(Lcog)
+
+    RUAcog = RESAS * UAcogR                                    # Right Upper Arm CofG
+    RFAcog = RESAS + (RWSAS - RESAS) * FAcogR                # Right Forearm CofG
+    RHcog = RWSAS + (RHSAS - RWSAS) * HcogR                  # Right Hand CofG
+    if _DEBUG:
+        Rcog = np.stack((RUAcog, RFAcog, RHcog))    # created for display
+        #print("Rcog =")
+        #print(Rcog)
+
+    # Segment weights (N)
+    UAwt = bm * UAmassR * 9.81    # Upper arm weight (right or left)
+    FAwt = bm * FAmassR * 9.81    # Forearm weight
+    Hwt = bm * HmassR * 9.81      # Hand weight
+
+    # Segment moments caused at shoulder
+    # Left Arm
+    LUAmom = _cross3(LUAcog, GravitySAS) * UAwt    # shoulder moment caused by Left Upper Arm
+    LFAmom = _cross3(LFAcog, GravitySAS) * FAwt    # shoulder moment caused by Left Forearm
+    LHmom = _cross3(LHcog, GravitySAS) * Hwt       # shoulder moment caused by Left Hand
+    LTotmom = LUAmom + LFAmom + LHmom               # Left: total moment caused by gravity
+    LTotmomRes = np.linalg.norm(LTotmom)            # Total shoulder moment caused by Left segments
+    if _DEBUG:
+        Lmom = np.array(((LUAmom[0], LUAmom[1], LUAmom[2], 0.0),
+                         (LFAmom[0], LFAmom[1], LFAmom[2], 0.0),
+                         (LHmom[0], LHmom[1], LHmom[2], 0.0),
+                         (LTotmom[0], LTotmom[1], LTotmom[2], LTotmomRes)))    # created for display
+        #print("Lmom =")
+        #print(Lmom)
+
+    LTotmomUV = LTotmom / LTotmomRes
+    LReach = np.linalg.norm(LHSAS)    # Left reach distance
+    #print("LReach =", LReach)
+    LReachUV = LHSAS / LReach         # Left reach unit vector
+    # Left direction of gravity contribution to MAS, scaled straight to the
+    # GFE magnitude (the cross of two unit vectors has norm sin(theta), so one
+    # sqrt both normalizes and applies the resultant)
+    Lcx = LTotmomUV[1]*LReachUV[2] - LTotmomUV[2]*LReachUV[1]
+    Lcy = LTotmomUV[2]*LReachUV[0] - LTotmomUV[0]*LReachUV[2]
+    Lcz = LTotmomUV[0]*LReachUV[1] - LTotmomUV[1]*LReachUV[0]
+    LGFEres = LTotmomRes / LReach     # Left Gravity Force Effect resultant
+    Linv = LGFEres / math.sqrt(Lcx*Lcx + Lcy*Lcy + Lcz*Lcz)
+    LGFE = np.array((Lcx*Linv, Lcy*Linv, Lcz*Linv))    # Left Gravity Force Effect vector
+    if _DEBUG:
+        Lvectors = np.array(((LTotmomUV[0], LTotmomUV[1], LTotmomUV[2], 0.0),
+                             (LReachUV[0], LReachUV[1], LReachUV[2], 0.0),
+                             (Lcx, Lcy, Lcz, 0.0),
+                             (LGFE[0], LGFE[1], LGFE[2], LGFEres)))    # created for display
+        #print("Lvectors =")
+        #print(Lvectors)
+
+    # Right Arm
+    RUAmom = _cross3(RUAcog, GravitySAS) * UAwt    # shoulder moment caused by Right Upper Arm
+    RFAmom = _cross3(RFAcog, GravitySAS) * FAwt    # shoulder moment caused by Right Forearm
+    RHmom = _cross3(RHcog, GravitySAS) * Hwt       # shoulder moment caused by Right Hand
+    RTotmom = RUAmom + RFAmom + RHmom               # Total shoulder moment caused by Right segments
+    RTotmomRes = np.linalg.norm(RTotmom)
+    if _DEBUG:
+        Rmom = np.array(((RUAmom[0], RUAmom[1], RUAmom[2], 0.0),
+                         (RFAmom[0], RFAmom[1], RFAmom[2], 0.0),
+                         (RHmom[0], RHmom[1], RHmom[2], 0.0),
+                         (RTotmom[0], RTotmom[1], RTotmom[2], RTotmomRes)))    # created for display
+        #print("Rmom =")
+        #print(Rmom)
+
+    RTotmomUV = RTotmom / RTotmomRes
+    RReach = np.linalg.norm(RHSAS)    # Right reach distance
+    #print("RReach =", RReach)
+    RReachUV = RHSAS / RReach         # Right reach unit vector
+    # Right direction of gravity contribution to MAS (same fused form as Left)
+    Rcx = RTotmomUV[1]*RReachUV[2] - RTotmomUV[2]*RReachUV[1]
+    Rcy = RTotmomUV[2]*RReachUV[0] - RTotmomUV[0]*RReachUV[2]
+    Rcz = RTotmomUV[0]*RReachUV[1] - RTotmomUV[1]*RReachUV[0]
+    RGFEres = RTotmomRes / RReach     # Right Gravity Force Effect resultant
+    Rinv = RGFEres / math.sqrt(Rcx*Rcx + Rcy*Rcy + Rcz*Rcz)
+    RGFE = np.array((Rcx*Rinv, Rcy*Rinv, Rcz*Rinv))    # Right Gravity Force Effect vector
+    if _DEBUG:
+        Rvectors = np.array(((RTotmomUV[0], RTotmomUV[1], RTotmomUV[2], 0.0),
+                             (RReachUV[0], RReachUV[1], RReachUV[2], 0.0),
+                             (Rcx, Rcy, Rcz, 0.0),
+                             (RGFE[0], RGFE[1], RGFE[2], RGFEres)))    # created for display
+        #print("Rvectors =")
+        #print(Rvectors)
+
+    # inputs to the ANN    (SI (y) , AP (z), ML (x))
+    # both arms assembled in one (18,2) matrix: column 0 = Left, column 1 = Right
+    H = np.stack((LHSAS, RHSAS))    # Hand Location wrt Shoulder (r)
+    F = np.stack((LFSAS, RFSAS))    # Force unit vectors (F)
+    F[0, 2] *= -1.0                 # reverse ML for Left arm
+
+    ANNin = np.empty((18, 2), dtype=np.float32)
+    for arm in range(2):
+        rSI, rAP, rML = H[arm, 1], H[arm, 0], H[arm, 2]
+        fSI, fAP, fML = F[arm, 1], F[arm, 0], F[arm, 2]
+        p3 = math.sqrt(rAP**2 + rML**2)                # 2D Projection or r on plane
+        p4 = math.sqrt(rSI**2 + rML**2)
+        p5 = math.sqrt(rSI**2 + rAP**2)
+        m0 = (rAP * fML) - (rML * fAP)                 # DC of 3D moment arm (DC or r x F)
+        m1 = (rML * fSI) - (rSI * fML)
+        m2 = (rSI * fAP) - (rAP * fSI)
+        mag = math.sqrt(m0**2 + m1**2 + m2**2)         # resultant of 3D moment arm (3DMA)
+        # stores run down the column in index order so the writes are one
+        # monotonic pass through the arm's cache lines
+        ANNin[0, arm] = rSI                            # Hand Location wrt Shoulder (r)
+        ANNin[1, arm] = rAP
+        ANNin[2, arm] = rML
+        ANNin[3, arm] = p3
+        ANNin[4, arm] = p4
+        ANNin[5, arm] = p5
+        ANNin[6, arm] = fSI                            # direction cosine (DC) of Force unit vector (F)
+        ANNin[7, arm] = fAP
+        ANNin[8, arm] = fML
+        ANNin[9, arm] = m0
+        ANNin[10, arm] = m1
+        ANNin[11, arm] = m2
+        ANNin[12, arm] = mag
+        ANNin[13, arm] = mag**2                        # 3DMA^2
+        ANNin[14, arm] = mag**3                        # 3DMA^3
+        ANNin[15, arm] = p3 * fSI                      # DC of F x 2D projection of r
+        ANNin[16, arm] = p4 * fAP
+        ANNin[17, arm] = p5 * fML
+    #print("ANNin =")
+    #print(ANNin)
+
+    # MaxMin Function to Modify the Original Input
+    # broadcast gain/offset over the 18 inputs for both arms at once
+    p = in1gain[:, None] * (ANNin - in1offset[:, None]) - np.float32(1.0)
+
+    # Layer 1 operations
+    # both arms at once: one 13x18 by 18x2 matrix product (p * Layer 1 coefficients)
+    a = np.tanh(Layer1c @ p + Layer1b[:, None])    # TanH of (bias + sum) for each node
+    #print("a =")
+    #print(a)
+
+    # Layer 2 operations
+    Lsum2, Rsum2 = Layer2b + Layer2c @ a    # Layer 2 bias plus summed values for Layer 2
+
+    #print("Lsum2 =", Lsum2)       # for display
+    #print("Rsum2 =", Rsum2)
+
+    # ANN Output
+    Lmas = (Lsum2 + 1)/OUTgain + OUToffset    # ANN raw maximum arm strength estimates
+    Rmas = (Rsum2 + 1)/OUTgain + OUToffset
+    #print("Lmas =", Lmas)
+    #print("Rmas =", Rmas)
+
+    # Height Code   (-1 for < - 0.01, 0 for between -0.01 & 0.01, 1 for > 0.01)
+    Htband = 0.01
+    Lht = int(np.sign(LHSAS[1])) * int(abs(LHSAS[1]) > Htband)
+    Rht = int(np.sign(RHSAS[1])) * int(abs(RHSAS[1]) > Htband)
+
+    # Ant/Post Force Code (-1 for negative, 0 for 0, +1 for positive)
+    Lap = int(np.sign(LFSAS[0]))
+    Rap = int(np.sign(RFSAS[0]))
+    #print("Lap =", Lap)
+    #print("Rap =", Rap)
+
+    # Sup/Inferior Force Code  (-1 for negative, 0 for 0, +1 for positive)
+    Lsi = int(np.sign(LFSAS[1]))
+    Rsi = int(np.sign(RFSAS[1]))
+
+    # Med/Lateral Force Code  (-1 for negative, 0 for 0, +1 for positive)
+    Lml = int(np.sign(-LFSAS[2]))    # must switch polarity for left side
+    Rml = int(np.sign(RFSAS[2]))
+
+    if _DEBUG:
+        Lcode = (Lht, Lap, Lsi, Lml)
+        Rcode = (Rht, Rap, Rsi, Rml)
+        #print("Lcode =", Lcode)
+        #print("Rcode =", Rcode)
+
+    # add 1 to each code and pack base-3 for look-up in the flat arrays
+    Lidx = (Lht+1)*27 + (Lap+1)*9 + (Lsi+1)*3 + (Lml+1)
+    Ridx = (Rht+1)*27 + (Rap+1)*9 + (Rsi+1)*3 + (Rml+1)
+    Lmin = MinMAS[Lidx]
+    Lmax = MaxMAS[Lidx]
+    Rmin = MinMAS[Ridx]
+    Rmax = MaxMAS[Ridx]
+
+    # bounding to Minimum and Maximum MAS values (branchless clip)
+    Lmas = min(max(Lmas, Lmin), Lmax)
+    Rmas = min(max(Rmas, Rmin), Rmax)
+
+    t = 'Mean 0G MAS values'
+    #print(t)
+    #print("Lmas =", Lmas)   # for display
+    #print("Rmas =", Rmas)
+
+    # _____________________________________________________________________________________________
+    # Estimate of Zero-Gravity maximum arm strength (MAS) for selected population
+    Lsd = Lmas * CV    # estimate of standard deviation based on mean and global CV value
+    Rsd = Rmas * CV
+
+    t = 'MAS - including gravity and percentile'
+    #print(t)
+    L0gMAS = Lmas + zprob * Lsd    # Zero G MAS values based on percent capable selected
+    R0gMAS = Rmas + zprob * Rsd
+
+    # component of gravity acting along the force vector (gravity assist)
+    Lga = LGFE @ (LFSAS * SIGN_L)    # must reverse lateral side for Left
+    Rga = RGFE @ RFSAS
+    #print("Lga =", Lga)
+    #print("Rga =", Rga)
+
+    # Final MAS value (with Gravity)
+    LMASwG = L0gMAS + Lga
+    RMASwG = R0gMAS + Rga
+
+    # Percentage capable of the actual loads
+    LActualLoad0G = LActualLoad - Lga
+    RActualLoad0G = RActualLoad - Rga
+    LMASprob = 0.5 * math.erfc((LActualLoad0G - Lmas) / (Lsd * math.sqrt(2.0))) * 100
+    RMASprob = 0.5 * math.erfc((RActualLoad0G - Rmas) / (Rsd * math.sqrt(2.0))) * 100
+
+    return LMASwG, RMASwG, LMASprob, RMASprob
+
+# Variable Inputs _______________________________________
+# coordinates for each joint and the direction of the force vectors
+#   1 = Left Hand/Knuckle
+#   2 = Left Wrist
+#   3 = Left Elbow
+#   4 = Left Shoulder
+
+#   5 = Right Hand/Knuckle
+#   6 = Right Wrist
+#   7 = Right Elbow
+#   8 = Right Shoulder
+
+#   9 = C7T1
+#   10 = L5S1
+
+#   11 = Left Hand Force Vector (in Global)
+#   12 = Right Hand Force Vector (in Global)
+
+# Example coordinates (m) and hand loads (N)
+# this would be replaced with coordinate data from DHM
+xyz = np.array([
+    [0.29034, 0.91934, 0.29134],     # 0: Left Hand/Knuckle
+    [0.26170, 0.96619, 0.23538],     # 1: Left Wrist
+    [0.19100, 1.11068, 0.09171],     # 2: Left Elbow
+    [0.09191, 1.30461, -0.06136],    # 3: Left Shoulder
+    [-0.37368, 1.20097, 0.360862],   # 4: Right Hand/Knuckle
+    [-0.36905, 1.20173, 0.28260],    # 5: Right Wrist
+    [-0.42676, 1.28636, 0.09280],    # 6: Right Elbow
+    [-0.21538, 1.32291, -0.06481],   # 7: Right Shoulder
+    [-0.06385, 1.35457, -0.06182],   # 8: C7T1
+    [-0.06300, 0.95253, -0.07984],   # 9: L5S1
+    [0.000, 1.000, 0.000],           # 10: Left Hand Force Vector
+    [0.000, 1.000, 0.000]            # 11: Right Hand Force Vector
+])
+
+LActualLoad = 50        # actual force at the left knuckle (used to determine % capable)
+RActualLoad = 50        # at the right knuckle
+print("LActualLoad =", LActualLoad, "N")
+print("RActualLoad =", RActualLoad, "N")
 
+# z-score for the selected percent capable (constant per population, so
+# computed once here rather than inside the compiled per-frame function)
 prob = 1 - pc/100
-t = 'MAS - including gravity and percentile'
-#print(t)
-L0gMAS = stats.norm.ppf(prob, Lmas, Lsd)    # Zero G MAS values based on percent capable selected
-R0gMAS = stats.norm.ppf(prob, Rmas, Rsd)
+zprob = ndtri(prob)
 
-# component of gravity acting along the force vector (gravity assist)
-Lga = (LGFE[0] * LFSAS[0]) + (LGFE[1] * LFSAS[1]) + (LGFE[2] * -LFSAS[2])    # must reverse lateral side for Left
-Rga = (RGFE[0] * RFSAS[0]) + (RGFE[1] * RFSAS[1]) + (RGFE[2] * RFSAS[2])
-#print("Lga =", Lga)
-#print("Rga =", Rga)
+LMASwG, RMASwG, LMASprob, RMASprob = score(
+    xyz, bm, CV, zprob, Layer1b, Layer1c, Layer2b, Layer2c,
+    in1gain, in1offset, OUTgain, OUToffset, MinMAS, MaxMAS,
+    LActualLoad, RActualLoad)
 
 # Final MAS value (with Gravity)
-LMASwG = L0gMAS + Lga
-RMASwG = R0gMAS + Rga
 print("LMASwG =", LMASwG)
 print("RMASwG =", RMASwG)
 
 # Percentage capable of the actual loads
-LActualLoad0G = LActualLoad - Lga
-RActualLoad0G = RActualLoad - Rga
 t = 'Percent Capable - including gravity and percentile'
 print(t)
-LMASprob = (1 - stats.norm.cdf(LActualLoad0G, Lmas, Lsd)) * 100
-RMASprob = (1 - stats.norm.cdf(RActualLoad0G, Rmas, Rsd)) * 100
 print("LMASprob =", LMASprob)
 print("RMASprob =", RMASprob)
 